@@ -1,7 +1,12 @@
 """Command-line interface for JSMiner."""
 
 import asyncio
+from collections import defaultdict
+from collections.abc import Coroutine
+from itertools import islice
 from pathlib import Path
+from typing import Any
+from urllib.parse import urlparse
 
 import click
 from rich.console import Console
@@ -16,6 +21,11 @@ from jsminer.export.html import HTMLExporter
 from jsminer.export.json import JSONExporter
 from jsminer.scanner.analyzer import JSAnalyzer
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 console = Console()
 
 BANNER = r"""
@@ -82,6 +92,22 @@ BANNER = r"""
     type=int,
     help="Request timeout in seconds (default: 30)",
 )
+@click.option(
+    "--preflight",
+    is_flag=True,
+    help="Send a HEAD request first and skip files over the size limit",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False),
+    help="Cache files here and revalidate them with ETag/Last-Modified on later scans",
+)
+@click.option(
+    "-w",
+    "--workers",
+    type=int,
+    help="Processes used to analyze JavaScript files (default: CPU count)",
+)
 @click.option(
     "--no-endpoints",
     is_flag=True,
@@ -113,6 +139,9 @@ def main(
     concurrent: int,
     delay: float,
     timeout: int,
+    preflight: bool,
+    cache_dir: str | None,
+    workers: int | None,
     no_endpoints: bool,
     no_secrets: bool,
     no_urls: bool,
@@ -146,6 +175,9 @@ def main(
         max_concurrent=concurrent,
         delay=delay,
         timeout=timeout,
+        preflight_head=preflight,
+        cache_dir=cache_dir,
+        workers=workers,
         extract_endpoints=not no_endpoints,
         extract_secrets=not no_secrets,
         extract_urls=not no_urls,
@@ -157,9 +189,9 @@ def main(
         result = analyze_local_file(Path(local_file), config)
         results = [result]
     elif url_list:
-        results = asyncio.run(analyze_url_list(Path(url_list), config))
+        results = run_async(analyze_url_list(Path(url_list), config))
     else:
-        results = asyncio.run(analyze_single_url(url, config))
+        results = run_async(analyze_single_url(url, config))
 
     # Display results
     for result in results:
@@ -170,19 +202,23 @@ def main(
         export_results(results, Path(output), json_output)
 
 
+def run_async(coro: Coroutine[Any, Any, list[ScanResult]]) -> list[ScanResult]:
+    """Run an analysis coroutine, on uvloop when it is installed."""
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(coro)
+
+
 async def analyze_single_url(url: str, config: Config) -> list[ScanResult]:
     """Analyze a single URL."""
-    analyzer = JSAnalyzer(config)
-
-    try:
+    async with JSAnalyzer(config) as analyzer:
         with console.status(f"[bold green]Analyzing {url}..."):
             if url.lower().endswith((".js", ".mjs", ".jsx")):
                 result = await analyzer.analyze_js_url(url)
             else:
                 result = await analyzer.analyze_url(url)
-        return [result]
-    finally:
-        await analyzer.close()
+        report_connections(analyzer)
+    return [result]
 
 
 async def analyze_url_list(url_file: Path, config: Config) -> list[ScanResult]:
@@ -195,10 +231,28 @@ async def analyze_url_list(url_file: Path, config: Config) -> list[ScanResult]:
 
     console.print(f"[cyan]Found {len(urls)} URLs to analyze[/cyan]\n")
 
-    analyzer = JSAnalyzer(config)
-    results: list[ScanResult] = []
+    results: dict[int, ScanResult] = {}
 
-    try:
+    # Limit concurrency per host so one slow host cannot starve the others,
+    # with a wider global cap to keep many-host lists bounded
+    host_semaphores: defaultdict[str, asyncio.Semaphore] = defaultdict(
+        lambda: asyncio.Semaphore(config.max_concurrent)
+    )
+    global_semaphore = asyncio.Semaphore(config.max_concurrent * 4)
+
+    async def analyze(index: int, url: str) -> tuple[int, ScanResult]:
+        async with host_semaphores[urlparse(url).netloc.lower()]:
+            async with global_semaphore:
+                if url.lower().endswith((".js", ".mjs", ".jsx")):
+                    result = await analyzer.analyze_js_url(url)
+                else:
+                    result = await analyzer.analyze_url(url)
+            # Pace each host without holding a global slot
+            if config.delay > 0:
+                await asyncio.sleep(config.delay)
+        return index, result
+
+    async with JSAnalyzer(config) as analyzer:
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -208,31 +262,37 @@ async def analyze_url_list(url_file: Path, config: Config) -> list[ScanResult]:
         ) as progress:
             task = progress.add_task("Analyzing...", total=len(urls))
 
-            for url in urls:
-                progress.update(task, description=f"Analyzing {url[:50]}...")
+            # Run up to max_concurrent analyses at once, advancing as each finishes
+            for next_done in asyncio.as_completed(
+                [analyze(index, url) for index, url in enumerate(urls)]
+            ):
+                index, result = await next_done
+                results[index] = result
+                progress.update(task, advance=1, description=f"Analyzed {urls[index][:50]}...")
 
-                if url.lower().endswith((".js", ".mjs", ".jsx")):
-                    result = await analyzer.analyze_js_url(url)
-                else:
-                    result = await analyzer.analyze_url(url)
+        report_connections(analyzer)
 
-                results.append(result)
-                progress.advance(task)
+    return [results[index] for index in range(len(urls))]
 
-    finally:
-        await analyzer.close()
 
-    return results
+def report_connections(analyzer: JSAnalyzer) -> None:
+    """Show how often connections were reused, when verbose."""
+    stats = analyzer.fetcher.connection_stats
+    if stats is None or not stats.created + stats.reused:
+        return
+    console.print(
+        f"[dim]Connections: {stats.created} opened, {stats.reused} reused "
+        f"({stats.reuse_ratio:.0%} reuse)[/dim]"
+    )
 
 
 def analyze_local_file(file_path: Path, config: Config) -> ScanResult:
     """Analyze a local JavaScript file."""
     console.print(f"[cyan]Analyzing local file: {file_path}[/cyan]\n")
 
-    content = file_path.read_text(encoding="utf-8", errors="ignore")
     analyzer = JSAnalyzer(config)
 
-    return analyzer.analyze_content(content, str(file_path))
+    return analyzer.analyze_file(file_path)
 
 
 def display_result(result: ScanResult, verbose: bool) -> None:
@@ -242,8 +302,8 @@ def display_result(result: ScanResult, verbose: bool) -> None:
     # Summary panel
     stats = result.stats
     severity_counts = {
-        "critical": len(result.critical_findings),
-        "high": len(result.high_findings),
+        "critical": stats["critical"],
+        "high": stats["high"],
     }
 
     summary = f"""
@@ -259,10 +319,13 @@ def display_result(result: ScanResult, verbose: bool) -> None:
 """
     console.print(Panel(summary.strip(), title="[bold]Summary[/bold]", border_style="blue"))
 
-    # Critical and high findings
-    important_findings = [
-        f for f in result.findings if f.severity in (Severity.CRITICAL, Severity.HIGH)
-    ]
+    # Critical and high findings; only the first 20 are shown, so stop there
+    important_findings = list(
+        islice(
+            (f for f in result.findings if f.severity in (Severity.CRITICAL, Severity.HIGH)),
+            20,
+        )
+    )
 
     if important_findings:
         table = Table(title="[bold red]Critical & High Findings[/bold red]")
@@ -271,13 +334,19 @@ def display_result(result: ScanResult, verbose: bool) -> None:
         table.add_column("Value", max_width=60)
         table.add_column("Source")
 
-        for finding in important_findings[:20]:
+        # Most rows share a handful of source files; trim each path only once
+        source_names = {
+            source: source.rsplit("/", 1)[-1][:30]
+            for source in {finding.source_file for finding in important_findings}
+        }
+
+        for finding in important_findings:
             severity_color = "red" if finding.severity == Severity.CRITICAL else "yellow"
             table.add_row(
                 f"[{severity_color}]{finding.severity.value}[/{severity_color}]",
                 finding.type.value,
                 finding.value[:60] + "..." if len(finding.value) > 60 else finding.value,
-                finding.source_file.split("/")[-1][:30],
+                source_names[finding.source_file],
             )
 
         console.print(table)
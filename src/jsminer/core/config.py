@@ -1,6 +1,18 @@
 """Configuration for JSMiner."""
 
 from dataclasses import dataclass, field
+from importlib.util import find_spec
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from aiohttp import TraceConfig
+
+# Brotli is only advertised when aiohttp has a decoder for it
+_ACCEPT_ENCODING = (
+    "gzip, deflate, br"
+    if any(find_spec(name) is not None for name in ("brotli", "brotlicffi"))
+    else "gzip, deflate"
+)
 
 
 @dataclass
@@ -12,11 +24,16 @@ class Config:
     max_concurrent: int = 10
     user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
     delay: float = 0.5
+    pool_connections: int | None = None  # Connection pool size; None = 4 * max_concurrent
+    pool_per_host: int | None = None  # Per-host pool size; None = max_concurrent
+    trace_configs: list["TraceConfig"] = field(default_factory=list)  # aiohttp request tracing
 
     # Crawling settings
     crawl_depth: int = 2
     follow_redirects: bool = True
     max_js_size: int = 10 * 1024 * 1024  # 10MB
+    preflight_head: bool = False  # HEAD each file first to skip oversize bodies
+    cache_dir: str | None = None  # ETag cache for conditional requests; None = off
 
     # Analysis settings
     extract_endpoints: bool = True
@@ -24,6 +41,7 @@ class Config:
     extract_urls: bool = True
     extract_comments: bool = True
     min_confidence: float = 0.5
+    workers: int | None = None  # Analysis processes; None = CPU count, 1 = in-process
 
     # Output settings
     verbose: bool = False
@@ -34,7 +52,7 @@ class Config:
         default_factory=lambda: {
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
             "Accept-Language": "en-US,en;q=0.5",
-            "Accept-Encoding": "gzip, deflate",
+            "Accept-Encoding": _ACCEPT_ENCODING,
             "Connection": "keep-alive",
         }
     )
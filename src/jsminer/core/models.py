@@ -1,9 +1,10 @@
 """Data models for JSMiner."""
 
+from collections import Counter
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-
-from pydantic import BaseModel, Field
+from operator import attrgetter
 
 
 class FindingType(str, Enum):
@@ -77,7 +78,8 @@ class Severity(str, Enum):
     INFO = "info"
 
 
-class Finding(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Finding:
     """A single finding from JavaScript analysis."""
 
     type: FindingType
@@ -87,13 +89,18 @@ class Finding(BaseModel):
     source_file: str
     line_number: int | None = None
     context: str | None = None
-    confidence: float = Field(default=1.0, ge=0.0, le=1.0)
+    confidence: float = 1.0
+
+    def __post_init__(self) -> None:
+        if not 0.0 <= self.confidence <= 1.0:
+            raise ValueError(f"confidence must be between 0.0 and 1.0, got {self.confidence}")
 
     def __hash__(self) -> int:
         return hash((self.type, self.value, self.source_file))
 
 
-class JSFile(BaseModel):
+@dataclass(slots=True)
+class JSFile:
     """Represents a JavaScript file."""
 
     url: str
@@ -107,14 +114,15 @@ class JSFile(BaseModel):
         return self.content is not None and self.status_code == 200
 
 
-class ScanResult(BaseModel):
+@dataclass(slots=True)
+class ScanResult:
     """Results from scanning a target."""
 
     target: str
-    scan_time: datetime = Field(default_factory=datetime.now)
-    js_files: list[JSFile] = Field(default_factory=list)
-    findings: list[Finding] = Field(default_factory=list)
-    errors: list[str] = Field(default_factory=list)
+    scan_time: datetime = field(default_factory=datetime.now)
+    js_files: list[JSFile] = field(default_factory=list)
+    findings: list[Finding] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
 
     @property
     def endpoints(self) -> list[Finding]:
@@ -146,15 +154,18 @@ class ScanResult(BaseModel):
 
     @property
     def stats(self) -> dict[str, int]:
+        # Count by type and severity in C instead of building a list per bucket
+        types = Counter(map(attrgetter("type"), self.findings))
+        severities = Counter(map(attrgetter("severity"), self.findings))
         return {
             "js_files": len(self.js_files),
-            "js_files_success": len([f for f in self.js_files if f.success]),
+            "js_files_success": sum(1 for f in self.js_files if f.success),
             "total_findings": len(self.findings),
-            "endpoints": len(self.endpoints),
-            "api_keys": len(self.api_keys),
-            "secrets": len(self.secrets),
-            "urls": len(self.urls),
-            "credentials": len(self.credentials),
-            "critical": len(self.critical_findings),
-            "high": len(self.high_findings),
+            "endpoints": types[FindingType.ENDPOINT],
+            "api_keys": types[FindingType.API_KEY],
+            "secrets": types[FindingType.SECRET],
+            "urls": types[FindingType.URL],
+            "credentials": types[FindingType.CREDENTIAL],
+            "critical": severities[Severity.CRITICAL],
+            "high": severities[Severity.HIGH],
         }
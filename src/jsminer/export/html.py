@@ -1,21 +1,40 @@
 """HTML export for JSMiner."""
 
+from functools import cache
 from pathlib import Path
 
-from jinja2 import Environment, PackageLoader, select_autoescape
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    PackageLoader,
+    Template,
+    select_autoescape,
+)
+from jinja2.environment import TemplateStream
 
 from jsminer.core.models import ScanResult
 
+# Shared by all exporters; the packaged template never changes at runtime
+_ENV = Environment(
+    loader=PackageLoader("jsminer.export", "templates"),
+    autoescape=select_autoescape(["html", "xml"]),
+    bytecode_cache=FileSystemBytecodeCache(),
+    auto_reload=False,
+)
+
+
+@cache
+def _get_template() -> Template:
+    """Load and compile the report template once per process."""
+    return _ENV.get_template("report.html.j2")
+
 
 class HTMLExporter:
     """Export scan results to HTML."""
 
     def __init__(self) -> None:
         """Initialize the HTML exporter."""
-        self.env = Environment(
-            loader=PackageLoader("jsminer.export", "templates"),
-            autoescape=select_autoescape(["html", "xml"]),
-        )
+        self.env = _ENV
 
     def export(self, result: ScanResult, output_path: Path) -> None:
         """Export a single scan result to HTML.
@@ -24,15 +43,12 @@ class HTMLExporter:
             result: Scan result to export.
             output_path: Output file path.
         """
-        template = self.env.get_template("report.html.j2")
-        html = template.render(
+        stream = _get_template().stream(
             result=result,
             results=[result],
             is_single=True,
         )
-
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(html)
+        self._write(stream, output_path)
 
     def export_many(self, results: list[ScanResult], output_path: Path) -> None:
         """Export multiple scan results to HTML.
@@ -41,22 +57,25 @@ class HTMLExporter:
             results: List of scan results.
             output_path: Output file path.
         """
-        template = self.env.get_template("report.html.j2")
-
         # Aggregate stats
+        stats = [r.stats for r in results]
         total_stats = {
             "targets": len(results),
-            "js_files": sum(len(r.js_files) for r in results),
-            "findings": sum(len(r.findings) for r in results),
-            "critical": sum(len(r.critical_findings) for r in results),
-            "high": sum(len(r.high_findings) for r in results),
+            "js_files": sum(s["js_files"] for s in stats),
+            "findings": sum(s["total_findings"] for s in stats),
+            "critical": sum(s["critical"] for s in stats),
+            "high": sum(s["high"] for s in stats),
         }
 
-        html = template.render(
+        stream = _get_template().stream(
             results=results,
             total_stats=total_stats,
             is_single=False,
         )
+        self._write(stream, output_path)
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(html)
+    def _write(self, stream: TemplateStream, output_path: Path) -> None:
+        """Write a rendered report chunk by chunk instead of as one string."""
+        stream.enable_buffering(size=50)
+        with open(output_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            stream.dump(f)
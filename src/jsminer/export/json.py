@@ -5,6 +5,11 @@ from pathlib import Path
 
 from jsminer.core.models import ScanResult
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class JSONExporter:
     """Export scan results to JSON."""
@@ -17,9 +22,7 @@ class JSONExporter:
             output_path: Output file path.
         """
         data = self._result_to_dict(result)
-
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, default=str)
+        self._write(data, output_path)
 
     def export_many(self, results: list[ScanResult], output_path: Path) -> None:
         """Export multiple scan results to JSON.
@@ -32,6 +35,13 @@ class JSONExporter:
             "scans": [self._result_to_dict(r) for r in results],
             "summary": self._create_summary(results),
         }
+        self._write(data, output_path)
+
+    def _write(self, data: dict, output_path: Path) -> None:
+        """Serialize data to output_path, using orjson when available."""
+        if orjson is not None:
+            output_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str))
+            return
 
         with open(output_path, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2, default=str)
@@ -52,12 +62,14 @@ class JSONExporter:
                 }
                 for f in result.js_files
             ],
+            # FindingType, SecretType and Severity are str enums, which both json
+            # and orjson serialize as their values
             "findings": [
                 {
-                    "type": f.type.value,
+                    "type": f.type,
                     "value": f.value,
-                    "secret_type": f.secret_type.value if f.secret_type else None,
-                    "severity": f.severity.value,
+                    "secret_type": f.secret_type,
+                    "severity": f.severity,
                     "source_file": f.source_file,
                     "line_number": f.line_number,
                     "context": f.context,
@@ -70,10 +82,11 @@ class JSONExporter:
 
     def _create_summary(self, results: list[ScanResult]) -> dict:
         """Create summary statistics for multiple results."""
-        total_js = sum(len(r.js_files) for r in results)
-        total_findings = sum(len(r.findings) for r in results)
-        total_critical = sum(len(r.critical_findings) for r in results)
-        total_high = sum(len(r.high_findings) for r in results)
+        stats = [r.stats for r in results]
+        total_js = sum(s["js_files"] for s in stats)
+        total_findings = sum(s["total_findings"] for s in stats)
+        total_critical = sum(s["critical"] for s in stats)
+        total_high = sum(s["high"] for s in stats)
 
         return {
             "total_targets": len(results),
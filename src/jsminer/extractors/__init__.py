@@ -1,12 +1,14 @@
 """Extractors for JSMiner."""
 
-from jsminer.extractors.base import BaseExtractor
+from jsminer.extractors.base import BaseExtractor, LineIndex, ScanBuffer
 from jsminer.extractors.endpoints import EndpointExtractor
 from jsminer.extractors.secrets import SecretExtractor
 from jsminer.extractors.urls import URLExtractor
 
 __all__ = [
     "BaseExtractor",
+    "LineIndex",
+    "ScanBuffer",
     "SecretExtractor",
     "EndpointExtractor",
     "URLExtractor",
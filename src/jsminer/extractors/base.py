@@ -1,29 +1,102 @@
 """Base extractor class."""
 
+import mmap
+import re
 from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Iterator
 
-from jsminer.core.models import Finding
+from jsminer.core.models import Finding, FindingType
+from jsminer.patterns import RE_FALLBACKS
+
+_NEWLINE = re.compile("\n")
+
+
+class LineIndex:
+    """Newline offsets of one content string, built on the first lookup.
+
+    Files without findings never pay for the newline scan.
+    """
+
+    __slots__ = ("_content", "_offsets")
+
+    def __init__(self, content: str) -> None:
+        self._content = content
+        self._offsets: list[int] | None = None
+
+    def line_number(self, position: int) -> int:
+        """Get the 1-based line number of a content offset."""
+        if self._offsets is None:
+            self._offsets = [match.start() for match in _NEWLINE.finditer(self._content)]
+        return bisect_left(self._offsets, position) + 1
+
+
+class ScanBuffer:
+    """One file's content, prepared once and shared by every extractor.
+
+    google-re2 UTF-8 encodes a str on every scan and maps each match offset
+    back to characters. For ASCII content the encoded bytes are kept here and
+    scanned directly, since byte and character offsets coincide. Other
+    content is scanned with the ``re`` originals, whose character classes
+    also match non-ASCII whitespace and digits.
+
+    Args:
+        text: The content.
+        data: ``text`` already encoded, e.g. the mapping of an ASCII file.
+    """
+
+    __slots__ = ("text", "lines", "ascii", "_data")
+
+    def __init__(self, text: str, data: bytes | mmap.mmap | None = None) -> None:
+        self.text = text
+        self.lines = LineIndex(text)
+        self.ascii = text.isascii()
+        self._data = data
+
+    def finditer(self, pattern: re.Pattern[str], pos: int = 0) -> Iterator[re.Match[str]]:
+        """Iterate over matches of ``pattern`` from ``pos``, on the engine that fits."""
+        if isinstance(pattern, re.Pattern):
+            return pattern.finditer(self.text, pos)
+        if not self.ascii:
+            return RE_FALLBACKS[pattern].finditer(self.text, pos)
+        if self._data is None:
+            self._data = self.text.encode()
+        return pattern.finditer(self._data, pos)
+
+    def group(self, match: re.Match[str], index: int = 0) -> str:
+        """Return a match group as str, whichever target was scanned."""
+        return self.text[match.start(index) : match.end(index)]
 
 
 class BaseExtractor(ABC):
     """Base class for all extractors."""
 
     @abstractmethod
-    def extract(self, content: str, source_file: str) -> list[Finding]:
+    def extract(
+        self,
+        content: str,
+        source_file: str,
+        buffer: ScanBuffer | None = None,
+        seen: set[tuple[FindingType, str]] | None = None,
+    ) -> list[Finding]:
         """Extract findings from JavaScript content.
 
         Args:
             content: JavaScript file content.
             source_file: URL or path of the source file.
+            buffer: Shared ScanBuffer of ``content``; created if omitted.
+            seen: (type, value) pairs already reported, shared across
+                extractors and files. Matching values are skipped and new
+                findings are added to it.
 
         Returns:
             List of findings.
         """
         pass
 
-    def _get_line_number(self, content: str, match_start: int) -> int:
+    def _get_line_number(self, line_index: LineIndex, match_start: int) -> int:
         """Get line number for a match position."""
-        return content[:match_start].count("\n") + 1
+        return line_index.line_number(match_start)
 
     def _get_context(
         self, content: str, match_start: int, match_end: int, context_chars: int = 50
@@ -1,8 +1,8 @@
 """API endpoint extractor."""
 
 from jsminer.core.models import Finding, FindingType, Severity
-from jsminer.extractors.base import BaseExtractor
-from jsminer.patterns import ENDPOINT_PATTERNS
+from jsminer.extractors.base import BaseExtractor, ScanBuffer
+from jsminer.patterns import ENDPOINT_SCANS, compile_literals
 
 
 class EndpointExtractor(BaseExtractor):
@@ -33,6 +33,15 @@ class EndpointExtractor(BaseExtractor):
         "callback",
     }
 
+    # Keywords that mark an endpoint as high severity
+    CRITICAL_KEYWORDS = {
+        "admin",
+        "internal",
+        "debug",
+        "backup",
+        "config",
+    }
+
     # Common false positive patterns
     FALSE_POSITIVES = {
         "/static/",
@@ -56,41 +65,65 @@ class EndpointExtractor(BaseExtractor):
         "node_modules",
     }
 
-    def extract(self, content: str, source_file: str) -> list[Finding]:
+    def __init__(self) -> None:
+        """Initialize the extractor."""
+        # One C-level scan tests every literal of a set at once
+        self._false_positive_re = compile_literals(self.FALSE_POSITIVES)
+        self._critical_re = compile_literals(self.CRITICAL_KEYWORDS)
+        self._high_value_re = compile_literals(self.HIGH_VALUE_KEYWORDS)
+
+    def extract(
+        self,
+        content: str,
+        source_file: str,
+        buffer: ScanBuffer | None = None,
+        seen: set[tuple[FindingType, str]] | None = None,
+    ) -> list[Finding]:
         """Extract endpoints from JavaScript content."""
         findings: list[Finding] = []
         seen_endpoints: set[str] = set()
+        if buffer is None:
+            buffer = ScanBuffer(content)
+        if seen is None:
+            seen = set()
 
-        for pattern in ENDPOINT_PATTERNS:
-            for match in pattern.finditer(content):
-                endpoint = match.group(1) if match.lastindex else match.group(0)
+        # Few passes over content; lastindex identifies the matching pattern
+        for union, value_groups in ENDPOINT_SCANS:
+            for match in buffer.finditer(union):
+                endpoint = buffer.group(match, value_groups[match.lastindex])
 
                 # Normalize endpoint
                 endpoint = self._normalize_endpoint(endpoint)
                 if not endpoint:
                     continue
 
-                # Skip duplicates
+                # Skip duplicates, including repeats of already rejected false positives
                 if endpoint in seen_endpoints:
                     continue
+                seen_endpoints.add(endpoint)
 
                 # Skip false positives
                 if self._is_false_positive(endpoint):
                     continue
 
-                seen_endpoints.add(endpoint)
+                # Already reported by another extractor or file
+                key = (FindingType.ENDPOINT, endpoint)
+                if key in seen:
+                    continue
+                seen.add(key)
 
                 # Determine severity based on endpoint value
                 severity = self._get_severity(endpoint)
 
+                start, end = match.span()
                 findings.append(
                     Finding(
                         type=FindingType.ENDPOINT,
                         value=endpoint,
                         severity=severity,
                         source_file=source_file,
-                        line_number=self._get_line_number(content, match.start()),
-                        context=self._get_context(content, match.start(), match.end()),
+                        line_number=self._get_line_number(buffer.lines, start),
+                        context=self._get_context(content, start, end),
                         confidence=0.8,
                     )
                 )
@@ -111,8 +144,7 @@ class EndpointExtractor(BaseExtractor):
             return None
 
         # Remove query strings for deduplication
-        if "?" in endpoint:
-            endpoint = endpoint.split("?")[0]
+        endpoint = endpoint.partition("?")[0]
 
         # Remove trailing slashes
         endpoint = endpoint.rstrip("/")
@@ -121,19 +153,18 @@ class EndpointExtractor(BaseExtractor):
 
     def _is_false_positive(self, endpoint: str) -> bool:
         """Check if an endpoint is likely a false positive."""
-        endpoint_lower = endpoint.lower()
-        return any(fp in endpoint_lower for fp in self.FALSE_POSITIVES)
+        return self._false_positive_re.search(endpoint.lower()) is not None
 
     def _get_severity(self, endpoint: str) -> Severity:
         """Determine severity based on endpoint keywords."""
         endpoint_lower = endpoint.lower()
 
         # Critical endpoints
-        if any(kw in endpoint_lower for kw in ["admin", "internal", "debug", "backup", "config"]):
+        if self._critical_re.search(endpoint_lower):
             return Severity.HIGH
 
         # High-value endpoints
-        if any(kw in endpoint_lower for kw in self.HIGH_VALUE_KEYWORDS):
+        if self._high_value_re.search(endpoint_lower):
             return Severity.MEDIUM
 
         return Severity.INFO
@@ -1,13 +1,55 @@
 """Secret and API key extractor."""
 
-from jsminer.core.models import Finding, FindingType
-from jsminer.extractors.base import BaseExtractor
-from jsminer.patterns import API_KEY_PATTERNS, CREDENTIAL_PATTERNS, SECRET_PATTERNS
+import re
+
+from jsminer.core.models import Finding, FindingType, SecretType, Severity
+from jsminer.extractors.base import BaseExtractor, ScanBuffer
+from jsminer.patterns import (
+    API_KEY_PATTERNS,
+    CREDENTIAL_PATTERNS,
+    SECRET_ANCHORS,
+    SECRET_GATE,
+    SECRET_PATTERNS,
+    compile_literals,
+)
+
+# Every scan in order: API keys, other secrets, then credentials, the last
+# filtered for placeholders.
+# (pattern, finding type, secret type, severity, confidence, check false positives)
+_SCANS: list[tuple[re.Pattern[str], FindingType, SecretType, Severity, float, bool]] = [
+    *((p, FindingType.API_KEY, t, sev, c, False) for p, t, sev, c in API_KEY_PATTERNS),
+    *((p, FindingType.SECRET, t, sev, c, False) for p, t, sev, c in SECRET_PATTERNS),
+    *((p, FindingType.CREDENTIAL, t, sev, c, True) for p, t, sev, c in CREDENTIAL_PATTERNS),
+]
 
 
 class SecretExtractor(BaseExtractor):
     """Extract secrets, API keys, and credentials from JavaScript."""
 
+    # Substrings that mark a credential value as a placeholder
+    FALSE_POSITIVES = frozenset(
+        {
+            "password",
+            "secret",
+            "token",
+            "key",
+            "test",
+            "example",
+            "placeholder",
+            "your_",
+            "xxx",
+            "...",
+            "null",
+            "undefined",
+            "true",
+            "false",
+            "none",
+            "empty",
+            "default",
+            "sample",
+        }
+    )
+
     def __init__(self, min_confidence: float = 0.5) -> None:
         """Initialize the extractor.
 
@@ -15,112 +57,102 @@ class SecretExtractor(BaseExtractor):
             min_confidence: Minimum confidence threshold for findings.
         """
         self.min_confidence = min_confidence
-
-    def extract(self, content: str, source_file: str) -> list[Finding]:
+        # min_confidence is fixed per instance, so filter the scans once
+        self._scans = [scan for scan in _SCANS if scan[4] >= min_confidence]
+        self._false_positive_re = compile_literals(self.FALSE_POSITIVES)
+
+    def extract(
+        self,
+        content: str,
+        source_file: str,
+        buffer: ScanBuffer | None = None,
+        seen: set[tuple[FindingType, str]] | None = None,
+    ) -> list[Finding]:
         """Extract secrets from JavaScript content."""
         findings: list[Finding] = []
         seen_values: set[str] = set()
-
-        # Extract API keys
-        for pattern, secret_type, severity, confidence in API_KEY_PATTERNS:
-            if confidence < self.min_confidence:
+        if buffer is None:
+            buffer = ScanBuffer(content)
+        if seen is None:
+            seen = set()
+
+        # No pattern can match before the earliest hit of the combined gate
+        start = 0
+        # The gate has no ``re`` form, so non-ASCII content is scanned in full
+        if SECRET_GATE is not None and buffer.ascii:
+            first = next(buffer.finditer(SECRET_GATE), None)
+            if first is None:
+                return findings
+            start = first.start()
+        folded = content.lower()
+
+        # Bound once; the loop body runs per match
+        finditer = buffer.finditer
+        group = buffer.group
+        line_number = buffer.lines.line_number
+        get_context = self._get_context
+        append = findings.append
+
+        for pattern, finding_type, secret_type, severity, confidence, check_fp in self._scans:
+            pos = self._scan_start(pattern, content, folded, start)
+            if pos < 0:
                 continue
 
-            for match in pattern.finditer(content):
-                value = match.group(1) if match.lastindex else match.group(0)
+            for match in finditer(pattern, pos):
+                value = group(match, 1 if match.lastindex else 0)
                 if value in seen_values:
                     continue
-                seen_values.add(value)
-
-                findings.append(
-                    Finding(
-                        type=FindingType.API_KEY,
-                        value=value,
-                        secret_type=secret_type,
-                        severity=severity,
-                        source_file=source_file,
-                        line_number=self._get_line_number(content, match.start()),
-                        context=self._get_context(content, match.start(), match.end()),
-                        confidence=confidence,
-                    )
-                )
 
-        # Extract other secrets
-        for pattern, secret_type, severity, confidence in SECRET_PATTERNS:
-            if confidence < self.min_confidence:
-                continue
-
-            for match in pattern.finditer(content):
-                value = match.group(1) if match.lastindex else match.group(0)
-                if value in seen_values:
+                # Skip common false positives in credentials
+                if check_fp and self._is_false_positive(value):
                     continue
-                seen_values.add(value)
-
-                findings.append(
-                    Finding(
-                        type=FindingType.SECRET,
-                        value=value,
-                        secret_type=secret_type,
-                        severity=severity,
-                        source_file=source_file,
-                        line_number=self._get_line_number(content, match.start()),
-                        context=self._get_context(content, match.start(), match.end()),
-                        confidence=confidence,
-                    )
-                )
-
-        # Extract credentials
-        for pattern, secret_type, severity, confidence in CREDENTIAL_PATTERNS:
-            if confidence < self.min_confidence:
-                continue
 
-            for match in pattern.finditer(content):
-                value = match.group(1) if match.lastindex else match.group(0)
-                if value in seen_values:
-                    continue
+                seen_values.add(value)
 
-                # Skip common false positives
-                if self._is_false_positive(value):
+                # Already reported by another extractor or file
+                key = (finding_type, value)
+                if key in seen:
                     continue
+                seen.add(key)
 
-                seen_values.add(value)
-
-                findings.append(
+                match_start, match_end = match.span()
+                append(
                     Finding(
-                        type=FindingType.CREDENTIAL,
+                        type=finding_type,
                         value=value,
                         secret_type=secret_type,
                         severity=severity,
                         source_file=source_file,
-                        line_number=self._get_line_number(content, match.start()),
-                        context=self._get_context(content, match.start(), match.end()),
+                        line_number=line_number(match_start),
+                        context=get_context(content, match_start, match_end),
                         confidence=confidence,
                     )
                 )
 
         return findings
 
+    def _scan_start(self, pattern: re.Pattern[str], content: str, folded: str, start: int) -> int:
+        """Return the offset to scan ``pattern`` from, or -1 if it cannot match.
+
+        Patterns with literal anchors are skipped when no anchor occurs in the
+        content; otherwise scanning begins at the earliest anchor.
+        """
+        entry = SECRET_ANCHORS.get(pattern)
+        if entry is None:
+            return start
+
+        anchors, ignorecase = entry
+        if not ignorecase:
+            haystack = content
+        elif len(folded) == len(content):
+            haystack = folded
+        else:
+            # Lower-casing changed the length, so offsets no longer line up
+            return start if any(anchor in folded for anchor in anchors) else -1
+
+        hits = [hit for anchor in anchors if (hit := haystack.find(anchor, start)) >= 0]
+        return min(hits) if hits else -1
+
     def _is_false_positive(self, value: str) -> bool:
         """Check if a value is likely a false positive."""
-        false_positives = {
-            "password",
-            "secret",
-            "token",
-            "key",
-            "test",
-            "example",
-            "placeholder",
-            "your_",
-            "xxx",
-            "...",
-            "null",
-            "undefined",
-            "true",
-            "false",
-            "none",
-            "empty",
-            "default",
-            "sample",
-        }
-        value_lower = value.lower()
-        return any(fp in value_lower for fp in false_positives) or len(value) < 6
+        return len(value) < 6 or self._false_positive_re.search(value.lower()) is not None
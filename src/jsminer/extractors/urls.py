@@ -1,10 +1,17 @@
 """URL extractor."""
 
-from urllib.parse import urlparse
+from functools import lru_cache
+from urllib.parse import ParseResult, urlparse
 
 from jsminer.core.models import Finding, FindingType, Severity
-from jsminer.extractors.base import BaseExtractor
-from jsminer.patterns import URL_PATTERNS
+from jsminer.extractors.base import BaseExtractor, ScanBuffer
+from jsminer.patterns import URL_PATTERNS, compile_literals
+
+
+@lru_cache(maxsize=8192)
+def _parse(url: str) -> ParseResult:
+    """Parse a URL, memoized since the same URLs recur within and across files."""
+    return urlparse(url)
 
 
 class URLExtractor(BaseExtractor):
@@ -56,6 +63,16 @@ class URLExtractor(BaseExtractor):
         "github.com",
     }
 
+    # Severity keywords, matched against the lower-cased URL
+    _PRIVATE_NET_RE = compile_literals(
+        ["localhost", "127.0.0.1", "0.0.0.0", "192.168", "10.", "172.16"]
+    )
+    # Staging/dev environments and admin/api endpoints share one severity
+    _MEDIUM_RE = compile_literals(
+        ["staging", "dev", "test", "uat", "qa", "preprod", ".local", ".internal"]
+        + ["admin", "api", "debug"]
+    )
+
     def __init__(self, target_domain: str | None = None) -> None:
         """Initialize the extractor.
 
@@ -63,15 +80,27 @@ class URLExtractor(BaseExtractor):
             target_domain: Target domain to focus on (optional).
         """
         self.target_domain = target_domain
-
-    def extract(self, content: str, source_file: str) -> list[Finding]:
+        self._skip_exact = frozenset(self.SKIP_DOMAINS)
+        self._skip_suffixes = tuple("." + domain for domain in self.SKIP_DOMAINS)
+
+    def extract(
+        self,
+        content: str,
+        source_file: str,
+        buffer: ScanBuffer | None = None,
+        seen: set[tuple[FindingType, str]] | None = None,
+    ) -> list[Finding]:
         """Extract URLs from JavaScript content."""
         findings: list[Finding] = []
         seen_urls: set[str] = set()
+        if buffer is None:
+            buffer = ScanBuffer(content)
+        if seen is None:
+            seen = set()
 
         for pattern in URL_PATTERNS:
-            for match in pattern.finditer(content):
-                url = match.group(0)
+            for match in buffer.finditer(pattern):
+                url = buffer.group(match)
 
                 # Normalize URL
                 url = self._normalize_url(url)
@@ -88,6 +117,12 @@ class URLExtractor(BaseExtractor):
 
                 seen_urls.add(url)
 
+                # Already reported by another extractor or file
+                key = (FindingType.URL, url)
+                if key in seen:
+                    continue
+                seen.add(key)
+
                 # Determine severity based on URL
                 severity = self._get_severity(url)
 
@@ -97,7 +132,7 @@ class URLExtractor(BaseExtractor):
                         value=url,
                         severity=severity,
                         source_file=source_file,
-                        line_number=self._get_line_number(content, match.start()),
+                        line_number=self._get_line_number(buffer.lines, match.start()),
                         context=self._get_context(content, match.start(), match.end()),
                         confidence=0.9,
                     )
@@ -107,16 +142,12 @@ class URLExtractor(BaseExtractor):
 
     def _normalize_url(self, url: str) -> str | None:
         """Normalize and validate a URL."""
-        # Strip quotes and whitespace
-        url = url.strip("\"'`\n\r\t ,;")
-
-        # Remove trailing punctuation
-        while url and url[-1] in ".,;:!?)>]}'\"":
-            url = url[:-1]
+        # Strip quotes and whitespace, then trailing punctuation
+        url = url.strip("\"'`\n\r\t ,;").rstrip(".,;:!?)>]}'\"")
 
         # Validate URL structure
         try:
-            parsed = urlparse(url)
+            parsed = _parse(url)
             if not parsed.scheme or not parsed.netloc:
                 return None
         except Exception:
@@ -127,7 +158,7 @@ class URLExtractor(BaseExtractor):
     def _should_skip(self, url: str) -> bool:
         """Check if URL should be skipped."""
         try:
-            parsed = urlparse(url)
+            parsed = _parse(url)
             domain = parsed.netloc.lower()
 
             # Remove port
@@ -135,11 +166,7 @@ class URLExtractor(BaseExtractor):
                 domain = domain.split(":")[0]
 
             # Check against skip list
-            for skip_domain in self.SKIP_DOMAINS:
-                if domain == skip_domain or domain.endswith("." + skip_domain):
-                    return True
-
-            return False
+            return domain in self._skip_exact or domain.endswith(self._skip_suffixes)
         except Exception:
             return True
 
@@ -148,21 +175,11 @@ class URLExtractor(BaseExtractor):
         url_lower = url.lower()
 
         # Critical: internal/private networks
-        if any(
-            p in url_lower
-            for p in ["localhost", "127.0.0.1", "0.0.0.0", "192.168", "10.", "172.16"]
-        ):
+        if self._PRIVATE_NET_RE.search(url_lower):
             return Severity.HIGH
 
-        # High: staging/dev environments
-        if any(
-            p in url_lower
-            for p in ["staging", "dev", "test", "uat", "qa", "preprod", ".local", ".internal"]
-        ):
-            return Severity.MEDIUM
-
-        # Medium: admin/api endpoints
-        if any(p in url_lower for p in ["admin", "api", "debug"]):
+        # High: staging/dev environments; medium: admin/api endpoints
+        if self._MEDIUM_RE.search(url_lower):
             return Severity.MEDIUM
 
         return Severity.LOW
@@ -4,14 +4,26 @@ from jsminer.patterns.regex import (
     API_KEY_PATTERNS,
     CREDENTIAL_PATTERNS,
     ENDPOINT_PATTERNS,
+    ENDPOINT_SCANS,
+    RE_FALLBACKS,
+    SECRET_ANCHORS,
+    SECRET_GATE,
     SECRET_PATTERNS,
     URL_PATTERNS,
+    compile_literals,
+    literal_anchors,
 )
 
 __all__ = [
     "API_KEY_PATTERNS",
     "ENDPOINT_PATTERNS",
+    "ENDPOINT_SCANS",
+    "RE_FALLBACKS",
+    "SECRET_ANCHORS",
+    "SECRET_GATE",
     "SECRET_PATTERNS",
     "URL_PATTERNS",
     "CREDENTIAL_PATTERNS",
+    "compile_literals",
+    "literal_anchors",
 ]
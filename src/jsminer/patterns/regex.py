@@ -1,9 +1,16 @@
 """Regex patterns for extracting secrets, endpoints, and URLs from JavaScript."""
 
+import contextlib
 import re
+from collections.abc import Iterable
 
 from jsminer.core.models import SecretType, Severity
 
+try:
+    import re2
+except ImportError:
+    re2 = None
+
 # Type alias for pattern tuple: (pattern, secret_type, severity, confidence)
 PatternDef = tuple[re.Pattern[str], SecretType, Severity, float]
 
@@ -281,6 +288,156 @@ ENDPOINT_PATTERNS: list[re.Pattern[str]] = [
 ]
 
 
+def _compile_re2(pattern: str) -> re.Pattern[str] | None:
+    """Compile with google-re2, or return None if it is unavailable or rejects the pattern."""
+    if re2 is not None:
+        with contextlib.suppress(re2.error):
+            return re2.compile(pattern)
+    return None
+
+
+# The ``re`` original of every pattern recompiled with google-re2. re2's
+# \s, \d and \w only match ASCII, unlike those of ``re`` str patterns, so
+# content that is not ASCII is scanned with these; see ScanBuffer.finditer
+RE_FALLBACKS: dict[re.Pattern[str], re.Pattern[str]] = {}
+
+
+def _to_fast(pattern: re.Pattern[str]) -> re.Pattern[str]:
+    """Recompile a pattern with google-re2 when available, keeping its flags inline."""
+    body = pattern.pattern
+    if pattern.flags & re.IGNORECASE:
+        body = f"(?i:{body})"
+    fast = _compile_re2(body)
+    if fast is None:
+        return pattern
+    RE_FALLBACKS[fast] = pattern
+    return fast
+
+
+_METACHARS = frozenset(".^$*+?{}[]()|")
+
+
+def _top_level_split(source: str) -> list[str]:
+    """Split a pattern on ``|`` characters that are outside groups and classes."""
+    parts, depth, in_class, last, i = [], 0, False, 0, 0
+    while i < len(source):
+        c = source[i]
+        if c == "\\":
+            i += 1
+        elif in_class:
+            in_class = c != "]"
+        elif c == "[":
+            in_class = True
+        elif c == "(":
+            depth += 1
+        elif c == ")":
+            depth -= 1
+        elif c == "|" and depth == 0:
+            parts.append(source[last:i])
+            last = i + 1
+        i += 1
+    parts.append(source[last:])
+    return parts
+
+
+def _leading_literal(source: str) -> str:
+    """Return the run of literal characters every match of ``source`` starts with."""
+    literal: list[str] = []
+    i = 0
+    while i < len(source):
+        c = source[i]
+        if c == "\\" and i + 1 < len(source) and not source[i + 1].isalnum():
+            literal.append(source[i + 1])
+            i += 2
+        elif c == "\\" or c in _METACHARS:
+            # An optional last character is not part of every match
+            if c in "?*{":
+                literal = literal[:-1]
+            break
+        else:
+            literal.append(c)
+            i += 1
+    return "".join(literal)
+
+
+def literal_anchors(pattern: re.Pattern[str]) -> tuple[str, ...] | None:
+    """Return literals one of which starts every match of ``pattern``.
+
+    Handles a leading literal run (``AKIA``, ``sk_live_``) and a leading group
+    of literal alternatives (``(?:password|passwd|pwd)``). Anchors of
+    case-insensitive patterns are lower-cased.
+
+    Returns:
+        The anchors, or None if the pattern does not start with a literal.
+    """
+    source = pattern.pattern
+    if len(_top_level_split(source)) > 1:
+        return None
+
+    if source.startswith("(?:"):
+        end = source.find(")")
+        inner = source[3:end]
+        # Only a flat group of alternatives, and one that cannot be skipped
+        if end < 0 or "(" in inner or source[end + 1 : end + 2] in ("?", "*", "{"):
+            return None
+        anchors = tuple(dict.fromkeys(_leading_literal(alt) for alt in _top_level_split(inner)))
+    else:
+        anchors = (_leading_literal(source),)
+
+    if not all(anchors):
+        return None
+    if pattern.flags & re.IGNORECASE:
+        anchors = tuple(anchor.lower() for anchor in anchors)
+    return anchors
+
+
+def compile_literals(literals: Iterable[str]) -> re.Pattern[str]:
+    """Compile literal strings into one alternation for a single-pass substring test."""
+    return re.compile("|".join(re.escape(literal) for literal in sorted(literals)))
+
+
+def _union(patterns: list[re.Pattern[str]]) -> tuple[re.Pattern[str], dict[int, int]]:
+    """Combine patterns into a single alternation so content is scanned once.
+
+    Each pattern becomes a named branch ``p<i>``; case-insensitive patterns are
+    scoped with an inline ``(?i:...)`` group to keep their original semantics.
+
+    Returns:
+        The combined pattern and a mapping from each branch's group index to
+        the group holding the extracted value.
+    """
+    branches = []
+    for i, pattern in enumerate(patterns):
+        body = pattern.pattern
+        if pattern.flags & re.IGNORECASE:
+            body = f"(?i:{body})"
+        branches.append(f"(?P<p{i}>{body})")
+
+    combined = re.compile("|".join(branches))
+    value_groups = {}
+    for i, pattern in enumerate(patterns):
+        index = combined.groupindex[f"p{i}"]
+        value_groups[index] = index + 1 if pattern.groups else index
+
+    return combined, value_groups
+
+
+# Endpoint scans as (pattern, value groups); see EndpointExtractor.extract.
+# The first five patterns match a quote, a run without quotes and a quote, so
+# one leftmost pass over them only misses a match that starts on the closing
+# quote of another, as in ``"/a/b"/v1/x"``, which JS does not produce. The {param},
+# fetch/axios and url= patterns can span several quotes; inside the union a
+# match of theirs would consume quotes the others start on, so each keeps its
+# own pass.
+ENDPOINT_SCANS = [
+    (_to_fast(union), value_groups)
+    for union, value_groups in (
+        _union(ENDPOINT_PATTERNS[:5]),
+        *(_union([pattern]) for pattern in ENDPOINT_PATTERNS[5:]),
+    )
+]
+
+
 # =============================================================================
 # URL PATTERNS
 # =============================================================================
@@ -328,3 +485,35 @@ CREDENTIAL_PATTERNS: list[PatternDef] = [
         0.7,
     ),
 ]
+
+
+# Earliest offset at which any secret or credential pattern matches, found in
+# one linear pass. Only built with google-re2: a backtracking union of these
+# patterns is slower than scanning them one by one.
+_RE_SECRET_PATTERNS = API_KEY_PATTERNS + SECRET_PATTERNS + CREDENTIAL_PATTERNS
+SECRET_GATE = _compile_re2(_union([p for p, *_ in _RE_SECRET_PATTERNS])[0].pattern)
+
+
+def _to_fast_defs(defs: list[PatternDef]) -> list[PatternDef]:
+    """Recompile every pattern of a PatternDef list with _to_fast."""
+    return [(_to_fast(pattern), *rest) for pattern, *rest in defs]
+
+
+# The lists above are written against ``re`` so flags stay readable; swap in
+# the linear-time engine once, after everything derived from them is built.
+API_KEY_PATTERNS = _to_fast_defs(API_KEY_PATTERNS)
+SECRET_PATTERNS = _to_fast_defs(SECRET_PATTERNS)
+CREDENTIAL_PATTERNS = _to_fast_defs(CREDENTIAL_PATTERNS)
+URL_PATTERNS = [_to_fast(pattern) for pattern in URL_PATTERNS]
+
+# Literal anchors of the secret patterns and whether to match them against
+# lower-cased content; see SecretExtractor._scan_start
+SECRET_ANCHORS = {
+    fast: (anchors, bool(pattern.flags & re.IGNORECASE))
+    for (fast, *_), (pattern, *_) in zip(
+        API_KEY_PATTERNS + SECRET_PATTERNS + CREDENTIAL_PATTERNS,
+        _RE_SECRET_PATTERNS,
+        strict=True,
+    )
+    if (anchors := literal_anchors(pattern)) is not None
+}
@@ -1,11 +1,14 @@
 """Scanner module for JSMiner."""
 
 from jsminer.scanner.analyzer import JSAnalyzer
+from jsminer.scanner.cache import FetchCache
 from jsminer.scanner.crawler import JSCrawler
-from jsminer.scanner.fetcher import JSFetcher
+from jsminer.scanner.fetcher import ConnectionStats, JSFetcher
 
 __all__ = [
     "JSFetcher",
     "JSCrawler",
     "JSAnalyzer",
+    "FetchCache",
+    "ConnectionStats",
 ]
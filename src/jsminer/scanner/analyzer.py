@@ -1,13 +1,85 @@
 """JavaScript content analyzer."""
 
+import asyncio
+import mmap
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from pathlib import Path
+from typing import Self
+
 from jsminer.core.config import Config
-from jsminer.core.models import Finding, JSFile, ScanResult
+from jsminer.core.models import Finding, FindingType, JSFile, ScanResult
+from jsminer.extractors.base import BaseExtractor, ScanBuffer
 from jsminer.extractors.endpoints import EndpointExtractor
 from jsminer.extractors.secrets import SecretExtractor
 from jsminer.extractors.urls import URLExtractor
 from jsminer.scanner.crawler import JSCrawler
 from jsminer.scanner.fetcher import JSFetcher
 
+# Extractors of a pool worker process, set once by _init_worker
+_worker_extractors: list[BaseExtractor] = []
+
+
+def _run_extractors(
+    extractors: list[BaseExtractor],
+    content: str,
+    source_file: str,
+    data: bytes | mmap.mmap | None = None,
+    seen: set[tuple[FindingType, str]] | None = None,
+) -> list[Finding]:
+    """Run extractors on content, optionally with its encoded bytes.
+
+    ``seen`` holds the (type, value) pairs already reported; extractors skip
+    them and add their own, so no duplicate Finding is ever built.
+    """
+    findings: list[Finding] = []
+    # Findings for the same file, across targets too, share one string
+    source_file = sys.intern(source_file)
+    # Encoded bytes and the line index are built once for all extractors
+    buffer = ScanBuffer(content, data)
+    if seen is None:
+        seen = set()
+
+    for extractor in extractors:
+        try:
+            extractor_findings = extractor.extract(content, source_file, buffer, seen)
+            findings.extend(extractor_findings)
+        except Exception:
+            pass  # Skip failed extractors
+
+    return findings
+
+
+def _build_extractors(config: Config) -> list[BaseExtractor]:
+    """Create the extractors enabled in a configuration."""
+    extractors: list[BaseExtractor] = []
+    if config.extract_secrets:
+        extractors.append(SecretExtractor(config.min_confidence))
+    if config.extract_endpoints:
+        extractors.append(EndpointExtractor())
+    if config.extract_urls:
+        extractors.append(URLExtractor())
+    return extractors
+
+
+def _init_worker(config: Config) -> None:
+    """Build the extractors of a pool worker.
+
+    Compiled patterns are looked up by identity in ``RE_FALLBACKS`` and
+    ``SECRET_ANCHORS``, which unpickled copies would miss, so each worker
+    builds its own from the configuration.
+    """
+    global _worker_extractors
+    _worker_extractors = _build_extractors(config)
+
+
+def _analyze_in_worker(content: str, source_file: str) -> list[Finding]:
+    """Run the worker's extractors on content."""
+    return _run_extractors(_worker_extractors, content, source_file)
+
 
 class JSAnalyzer:
     """Main analyzer that coordinates crawling, fetching, and extraction."""
@@ -20,16 +92,23 @@ class JSAnalyzer:
         """
         self.config = config or Config()
         self.fetcher = JSFetcher(self.config)
-        self.crawler = JSCrawler(self.config)
+        self.crawler = JSCrawler(self.config, self.fetcher)
 
         # Initialize extractors
-        self.extractors = []
-        if self.config.extract_secrets:
-            self.extractors.append(SecretExtractor(self.config.min_confidence))
-        if self.config.extract_endpoints:
-            self.extractors.append(EndpointExtractor())
-        if self.config.extract_urls:
-            self.extractors.append(URLExtractor())
+        self.extractors = _build_extractors(self.config)
+
+        # Extraction is CPU-bound, so files are spread over processes
+        self.workers = self.config.workers or os.cpu_count() or 1
+        self._pool: ProcessPoolExecutor | None = None
+
+    async def __aenter__(self) -> Self:
+        """Open the fetcher's session for the duration of the block."""
+        await self.fetcher.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close all resources."""
+        await self.close()
 
     async def analyze_url(self, url: str) -> ScanResult:
         """Analyze a single URL (crawl for JS files and analyze them).
@@ -55,16 +134,12 @@ class JSAnalyzer:
             result.js_files = js_files
 
             # Analyze each successful file
+            analyzable = [f for f in js_files if f.success and f.content]
+            result.findings = await self._analyze_files(analyzable)
             for js_file in js_files:
-                if js_file.success and js_file.content:
-                    findings = self._analyze_content(js_file.content, js_file.url)
-                    result.findings.extend(findings)
-                elif js_file.error:
+                if not (js_file.success and js_file.content) and js_file.error:
                     result.errors.append(f"{js_file.url}: {js_file.error}")
 
-            # Deduplicate findings
-            result.findings = self._deduplicate_findings(result.findings)
-
         except Exception as e:
             result.errors.append(f"Analysis error: {e}")
 
@@ -87,8 +162,7 @@ class JSAnalyzer:
             result.js_files = [js_file]
 
             if js_file.success and js_file.content:
-                findings = self._analyze_content(js_file.content, js_file.url)
-                result.findings = self._deduplicate_findings(findings)
+                result.findings = self._analyze_content(js_file.content, js_file.url)
             elif js_file.error:
                 result.errors.append(f"{js_file.url}: {js_file.error}")
 
@@ -125,41 +199,96 @@ class JSAnalyzer:
         Returns:
             ScanResult with all findings.
         """
+        return self._local_result(content, source, len(content))
+
+    def analyze_file(self, path: str | Path) -> ScanResult:
+        """Analyze a local JavaScript file.
+
+        The file is memory-mapped and decoded straight from the mapping. For
+        an ASCII file the mapping also serves as the bytes google-re2 scans,
+        so no encoded copy of the content is made.
+
+        Args:
+            path: Path of the JavaScript file.
+
+        Returns:
+            ScanResult with all findings.
+        """
+        source = str(path)
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if not size:
+                return self._local_result("", source, 0)
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                content = str(mapped, "utf-8", "ignore")
+                # Invalid UTF-8 was dropped if the lengths differ
+                data = mapped if content.isascii() and len(content) == size else None
+                return self._local_result(content, source, size, data)
+
+    def _local_result(
+        self, content: str, source: str, size: int, data: bytes | mmap.mmap | None = None
+    ) -> ScanResult:
+        """Build the ScanResult of content analyzed in-process."""
         result = ScanResult(target=source)
-        result.js_files = [JSFile(url=source, content=content, size=len(content), status_code=200)]
+        result.js_files = [JSFile(url=source, content=content, size=size, status_code=200)]
 
-        findings = self._analyze_content(content, source)
-        result.findings = self._deduplicate_findings(findings)
+        result.findings = _run_extractors(self.extractors, content, source, data)
 
         return result
 
-    def _analyze_content(self, content: str, source_file: str) -> list[Finding]:
+    def _analyze_content(
+        self, content: str, source_file: str, seen: set[tuple[FindingType, str]] | None = None
+    ) -> list[Finding]:
         """Run all extractors on content."""
-        findings: list[Finding] = []
+        return _run_extractors(self.extractors, content, source_file, seen=seen)
 
-        for extractor in self.extractors:
-            try:
-                extractor_findings = extractor.extract(content, source_file)
-                findings.extend(extractor_findings)
-            except Exception:
-                pass  # Skip failed extractors
+    async def _analyze_files(self, js_files: list[JSFile]) -> list[Finding]:
+        """Run all extractors on each file, in worker processes when there are several.
 
+        Returns:
+            The findings of all files, each (type, value) pair reported once.
+        """
+        seen: set[tuple[FindingType, str]] = set()
+        if self.workers < 2 or len(js_files) < 2:
+            findings: list[Finding] = []
+            for js_file in js_files:
+                findings.extend(self._analyze_content(js_file.content, js_file.url, seen))
+            return findings
+
+        if self._pool is None:
+            # spawn: forking a process that runs an event loop is unsafe
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                # Trace configs hold callbacks and only matter to the fetcher
+                initargs=(replace(self.config, trace_configs=[]),),
+            )
+        loop = asyncio.get_running_loop()
+        per_file = await asyncio.gather(
+            *(
+                loop.run_in_executor(self._pool, _analyze_in_worker, f.content, f.url)
+                for f in js_files
+            )
+        )
+
+        # Workers share no state, so repeats across files are dropped here
+        findings = []
+        for file_findings in per_file:
+            for finding in file_findings:
+                # The enum member itself hashes like its value, without the
+                # Enum.value property lookup
+                key = (finding.type, finding.value)
+                if key not in seen:
+                    seen.add(key)
+                    findings.append(finding)
         return findings
 
-    def _deduplicate_findings(self, findings: list[Finding]) -> list[Finding]:
-        """Remove duplicate findings."""
-        seen: set[tuple[str, str]] = set()
-        unique: list[Finding] = []
-
-        for finding in findings:
-            key = (finding.type.value, finding.value)
-            if key not in seen:
-                seen.add(key)
-                unique.append(finding)
-
-        return unique
-
     async def close(self) -> None:
         """Close all resources."""
         await self.fetcher.close()
         await self.crawler.close()
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
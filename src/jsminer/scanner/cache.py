@@ -0,0 +1,120 @@
+"""On-disk cache of fetched files for conditional requests."""
+
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+
+@dataclass(slots=True)
+class CacheEntry:
+    """Validators and body digest of a cached response."""
+
+    etag: str | None
+    last_modified: str | None
+    digest: str
+    charset: str | None = None
+
+
+class FetchCache:
+    """ETag / Last-Modified cache kept in a directory.
+
+    ``index.json`` maps each URL to its validators, and bodies are stored
+    once per SHA-256 digest under ``blobs/``, so a bundle served from
+    several URLs is kept once.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        """Initialize the cache, loading any existing index.
+
+        Args:
+            directory: Directory holding the index and blobs.
+        """
+        self.directory = Path(directory)
+        self._index_path = self.directory / "index.json"
+        self._blobs = self.directory / "blobs"
+        self._entries = self._load()
+        self._dirty = False
+
+    def _load(self) -> dict[str, CacheEntry]:
+        """Read the index, starting empty if it is missing or corrupt."""
+        try:
+            raw = json.loads(self._index_path.read_text(encoding="utf-8"))
+            return {url: CacheEntry(**entry) for url, entry in raw.items()}
+        except (OSError, ValueError, TypeError, AttributeError):
+            return {}
+
+    def headers(self, url: str) -> dict[str, str] | None:
+        """Get conditional request headers for a URL, if it is cached.
+
+        An entry whose blob is gone is dropped, since a 304 for it could not
+        be served; the URL is then fetched and stored anew.
+        """
+        entry = self._entries.get(url)
+        if entry is None:
+            return None
+        if not (self._blobs / entry.digest).exists():
+            del self._entries[url]
+            self._dirty = True
+            return None
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def load(self, url: str) -> tuple[bytes, str | None] | None:
+        """Get the cached body and charset for a URL.
+
+        Returns:
+            ``(body, charset)``, or None if the URL or its blob is missing.
+        """
+        entry = self._entries.get(url)
+        if entry is None:
+            return None
+        try:
+            return (self._blobs / entry.digest).read_bytes(), entry.charset
+        except OSError:
+            return None
+
+    def store(
+        self,
+        url: str,
+        body: bytes,
+        etag: str | None,
+        last_modified: str | None,
+        charset: str | None = None,
+    ) -> None:
+        """Cache a response body with its validators.
+
+        Responses without an ETag or Last-Modified header cannot be
+        revalidated, so they are not stored.
+        """
+        if not etag and not last_modified:
+            return
+
+        digest = hashlib.sha256(body).hexdigest()
+        blob = self._blobs / digest
+        if not blob.exists():
+            self._blobs.mkdir(parents=True, exist_ok=True)
+            _write_atomic(blob, body)
+        self._entries[url] = CacheEntry(etag, last_modified, digest, charset)
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the index if anything changed."""
+        if not self._dirty:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        data = {url: asdict(entry) for url, entry in self._entries.items()}
+        _write_atomic(self._index_path, json.dumps(data).encode("utf-8"))
+        self._dirty = False
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write through a temporary file so readers never see a partial file."""
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
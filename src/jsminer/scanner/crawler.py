@@ -1,12 +1,30 @@
 """Web crawler to find JavaScript files."""
 
 import re
+from importlib.util import find_spec
 from urllib.parse import urljoin, urlparse
 
-import aiohttp
 from bs4 import BeautifulSoup
 
 from jsminer.core.config import Config
+from jsminer.scanner.fetcher import JSFetcher
+
+# lxml is a C parser behind the same BeautifulSoup API
+_HTML_PARSER = "lxml" if find_spec("lxml") is not None else "html.parser"
+
+# Dynamically loaded scripts in inline code: scripts named in src and
+# require, in one pass since each of those matches spans a single quoted
+# string
+_INLINE_JS_RE = re.compile(
+    r"src\s*[=:]\s*[\"'](?P<src>[^\"']+\.js(?:\?[^\"']*)?)[\"']"
+    r"|require\s*\(\s*[\"'](?P<req>[^\"']+)[\"']",
+    re.IGNORECASE,
+)
+# Any quoted .js path, and import statements, whose lazy clause can run across
+# quoted strings on the same line. Each keeps its own pass: their matches share
+# quotes with the other forms, and one pass would drop whichever starts second.
+_QUOTED_JS_RE = re.compile(r"[\"']([^\"']*\.js(?:\?[^\"']*)?)[\"']", re.IGNORECASE)
+_IMPORT_JS_RE = re.compile(r"import\s+.*?\s+from\s+[\"']([^\"']+)[\"']", re.IGNORECASE)
 
 
 class JSCrawler:
@@ -15,24 +33,17 @@ class JSCrawler:
     # Patterns to find JS files
     JS_EXTENSIONS = {".js", ".mjs", ".jsx", ".ts", ".tsx"}
 
-    def __init__(self, config: Config | None = None) -> None:
+    def __init__(self, config: Config | None = None, fetcher: JSFetcher | None = None) -> None:
         """Initialize the crawler.
 
         Args:
             config: Configuration options.
+            fetcher: Fetcher to request pages with. Passing the fetcher used for
+                the JS files lets both share one keep-alive connection pool.
         """
         self.config = config or Config()
-        self._session: aiohttp.ClientSession | None = None
-
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create an aiohttp session."""
-        if self._session is None or self._session.closed:
-            headers = {
-                "User-Agent": self.config.user_agent,
-                **self.config.headers,
-            }
-            self._session = aiohttp.ClientSession(headers=headers)
-        return self._session
+        self._owns_fetcher = fetcher is None
+        self.fetcher = fetcher or JSFetcher(self.config)
 
     async def crawl(self, url: str) -> list[str]:
         """Crawl a URL and extract JavaScript file URLs.
@@ -43,54 +54,52 @@ class JSCrawler:
         Returns:
             List of discovered JavaScript file URLs.
         """
-        session = await self._get_session()
         js_urls: set[str] = set()
 
         try:
-            async with session.get(
-                url,
-                timeout=aiohttp.ClientTimeout(total=self.config.timeout),
-                allow_redirects=self.config.follow_redirects,
-            ) as response:
-                if response.status != 200:
-                    return []
-
-                html = await response.text()
-
-                # Parse HTML
-                soup = BeautifulSoup(html, "html.parser")
-
-                # Find script tags with src
-                for script in soup.find_all("script", src=True):
-                    src = script.get("src")
-                    if src:
-                        full_url = urljoin(url, src)
-                        if self._is_js_url(full_url):
-                            js_urls.add(full_url)
-
-                # Find inline scripts
-                for script in soup.find_all("script", src=False):
-                    content = script.string
-                    if content:
-                        # Look for dynamically loaded JS
-                        inline_urls = self._extract_js_urls_from_content(content, url)
-                        js_urls.update(inline_urls)
-
-                # Look for JS URLs in HTML attributes
-                for attr in ["data-src", "data-script", "data-main"]:
-                    for tag in soup.find_all(attrs={attr: True}):
-                        src = tag.get(attr)
+            page = await self.fetcher.fetch(url)
+            if not page.success or page.content is None:
+                return []
+
+            # Parse HTML
+            soup = BeautifulSoup(page.content, _HTML_PARSER)
+
+            # One walk over the tree, dispatching on tag name
+            for tag in soup.find_all(True):
+                if tag.name == "script":
+                    if tag.has_attr("src"):
+                        # Script tags with src
+                        src = tag.get("src")
                         if src:
                             full_url = urljoin(url, src)
                             if self._is_js_url(full_url):
                                 js_urls.add(full_url)
+                    else:
+                        # Inline scripts
+                        content = tag.string
+                        if content:
+                            # Look for dynamically loaded JS
+                            inline_urls = self._extract_js_urls_from_content(content, url)
+                            js_urls.update(inline_urls)
 
                 # Look for JS URLs in href (some sites use this)
-                for link in soup.find_all("link", rel="preload", href=True):
-                    if link.get("as") == "script":
-                        href = link.get("href")
-                        if href:
-                            full_url = urljoin(url, href)
+                elif (
+                    tag.name == "link"
+                    and tag.has_attr("href")
+                    and "preload" in tag.get_attribute_list("rel")
+                    and tag.get("as") == "script"
+                ):
+                    href = tag.get("href")
+                    if href:
+                        full_url = urljoin(url, href)
+                        js_urls.add(full_url)
+
+                # Look for JS URLs in HTML attributes
+                for attr in ("data-src", "data-script", "data-main"):
+                    src = tag.get(attr)
+                    if src:
+                        full_url = urljoin(url, src)
+                        if self._is_js_url(full_url):
                             js_urls.add(full_url)
 
         except Exception:
@@ -118,17 +127,9 @@ class JSCrawler:
         """Extract JS URLs from inline script content."""
         urls: set[str] = set()
 
-        # Pattern for dynamically loaded scripts
-        patterns = [
-            r'["\']([^"\']*\.js(?:\?[^"\']*)?)["\']',
-            r'src\s*[=:]\s*["\']([^"\']+\.js(?:\?[^"\']*)?)["\']',
-            r'import\s+.*?\s+from\s+["\']([^"\']+)["\']',
-            r'require\s*\(\s*["\']([^"\']+)["\']',
-        ]
-
-        for pattern in patterns:
-            for match in re.finditer(pattern, content, re.IGNORECASE):
-                path = match.group(1)
+        for pattern in (_QUOTED_JS_RE, _IMPORT_JS_RE, _INLINE_JS_RE):
+            for match in pattern.finditer(content):
+                path = match.group(match.lastindex)
                 if path and not path.startswith("data:"):
                     full_url = urljoin(base_url, path)
                     if self._is_js_url(full_url) or not any(
@@ -139,6 +140,6 @@ class JSCrawler:
         return urls
 
     async def close(self) -> None:
-        """Close the aiohttp session."""
-        if self._session and not self._session.closed:
-            await self._session.close()
+        """Close the fetcher if the crawler created it."""
+        if self._owns_fetcher:
+            await self.fetcher.close()
@@ -1,35 +1,198 @@
 """Async JavaScript file fetcher."""
 
 import asyncio
+import contextlib
+from collections.abc import AsyncIterator, Awaitable, Callable
+from importlib.util import find_spec
+from types import MappingProxyType
+from typing import Self
+from urllib.parse import urlsplit
 
 import aiohttp
 
 from jsminer.core.config import Config
 from jsminer.core.models import JSFile
+from jsminer.scanner.cache import FetchCache
+
+# aiodns resolves in the event loop instead of a getaddrinfo thread
+_HAS_AIODNS = find_spec("aiodns") is not None
+
+_CHUNK_SIZE = 64 * 1024
+
+
+def _is_fetchable(url: str) -> bool:
+    """Check that a URL is absolute HTTP(S) before it reaches the connector."""
+    parts = urlsplit(url)
+    return parts.scheme in ("http", "https") and bool(parts.netloc)
+
+
+def _decode(body: bytes | bytearray, charset: str | None) -> str:
+    """Decode a response body, falling back to UTF-8 for unknown charsets."""
+    try:
+        return body.decode(charset or "utf-8", errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
+def _fetched(url: str, content: str, size: int, status_code: int) -> JSFile:
+    """Build the JSFile for a downloaded body."""
+    return JSFile(url, content, size, status_code, None)
+
+
+def _failed(url: str, error: str, status_code: int | None = None) -> JSFile:
+    """Build the JSFile for a fetch that produced no content."""
+    return JSFile(url, None, 0, status_code, error)
+
+
+class ConnectionStats:
+    """Count new and reused connections through aiohttp's tracing hooks.
+
+    The connector calls these hooks itself, so nothing is added to the
+    fetch path; a low reuse ratio means keep-alive is not taking effect.
+    """
+
+    __slots__ = ("created", "reused", "trace_config")
+
+    def __init__(self) -> None:
+        self.created = 0
+        self.reused = 0
+        self.trace_config = aiohttp.TraceConfig()
+        self.trace_config.on_connection_create_end.append(self._on_create)
+        self.trace_config.on_connection_reuseconn.append(self._on_reuse)
+
+    async def _on_create(self, *_: object) -> None:
+        self.created += 1
+
+    async def _on_reuse(self, *_: object) -> None:
+        self.reused += 1
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Fraction of requests served on an already open connection."""
+        total = self.created + self.reused
+        return self.reused / total if total else 0.0
+
+
+class _Pacer:
+    """Space request starts at least ``interval`` seconds apart.
+
+    Each caller reserves the next start time synchronously and sleeps until
+    it, so nothing shared is held while waiting.
+    """
+
+    __slots__ = ("interval", "_next")
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._next = 0.0
+
+    async def wait(self) -> None:
+        """Wait for this caller's reserved start time."""
+        now = asyncio.get_running_loop().time()
+        start = max(now, self._next)
+        self._next = start + self.interval
+        if start > now:
+            await asyncio.sleep(start - now)
 
 
 class JSFetcher:
     """Async fetcher for JavaScript files."""
 
-    def __init__(self, config: Config | None = None) -> None:
+    def __init__(
+        self,
+        config: Config | None = None,
+        connector: aiohttp.BaseConnector | None = None,
+    ) -> None:
         """Initialize the fetcher.
 
         Args:
             config: Configuration options.
+            connector: Connector to share with other fetchers. It is left
+                open on close; by default the fetcher owns a private one.
         """
         self.config = config or Config()
         self._session: aiohttp.ClientSession | None = None
+        self._connector = connector
+        # Fixed for the fetcher's lifetime, so built once instead of per request
+        self._timeout = aiohttp.ClientTimeout(total=self.config.timeout)
+        self._allow_redirects = self.config.follow_redirects
+        self._preflight = self.config.preflight_head
+        self._max_size_digits = str(self.config.max_js_size)
+        # Only tracked when it will be reported
+        self.connection_stats = ConnectionStats() if self.config.verbose else None
+        self._cache = FetchCache(self.config.cache_dir) if self.config.cache_dir else None
+        self._headers = MappingProxyType(
+            {"User-Agent": self.config.user_agent, **self.config.headers}
+        )
+
+    async def __aenter__(self) -> Self:
+        """Open the session up front, bound to the running loop."""
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close the session."""
+        await self.close()
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create an aiohttp session."""
-        if self._session is None or self._session.closed:
-            headers = {
-                "User-Agent": self.config.user_agent,
-                **self.config.headers,
-            }
-            self._session = aiohttp.ClientSession(headers=headers)
+        # close() is the only place a session ends, and it resets this
+        if self._session is None:
+            connector = self._connector
+            if connector is None:
+                # Default limits match the CLI's admission: max_concurrent
+                # per host and four times that overall
+                connector = aiohttp.TCPConnector(
+                    limit=self.config.pool_connections or self.config.max_concurrent * 4,
+                    limit_per_host=self.config.pool_per_host or self.config.max_concurrent,
+                    keepalive_timeout=30,
+                    use_dns_cache=True,
+                    ttl_dns_cache=300,
+                    resolver=aiohttp.AsyncResolver() if _HAS_AIODNS else None,
+                )
+            self._session = aiohttp.ClientSession(
+                headers=self._headers,
+                connector=connector,
+                connector_owner=self._connector is None,
+                timeout=self._timeout,
+                trace_configs=self._trace_configs() or None,
+            )
         return self._session
 
+    def _exceeds_cap(self, content_length: str | None) -> bool:
+        """Check a Content-Length header against ``max_js_size``.
+
+        Compares digit strings instead of parsing an int: more digits means
+        larger, and equal lengths compare lexically. Malformed values are
+        left to the streaming cap.
+        """
+        if not content_length or not (content_length.isascii() and content_length.isdigit()):
+            return False
+        digits = content_length.lstrip("0")
+        cap = self._max_size_digits
+        return len(digits) > len(cap) or (len(digits) == len(cap) and digits > cap)
+
+    def _trace_configs(self) -> list[aiohttp.TraceConfig]:
+        """Collect the configured trace configs and the fetcher's own."""
+        trace_configs = list(self.config.trace_configs)
+        if self.connection_stats is not None:
+            trace_configs.append(self.connection_stats.trace_config)
+        return trace_configs
+
+    async def _preflight_head(self, session: aiohttp.ClientSession, url: str) -> JSFile | None:
+        """Send a HEAD and return a failure if it reports a body over the cap.
+
+        A HEAD costs one round trip but avoids downloading a body that would
+        be rejected. Servers that refuse HEAD, drop the connection or time
+        out on it fall through to the GET, where the streaming cap applies.
+        """
+        with contextlib.suppress(aiohttp.ClientError, TimeoutError):
+            async with session.head(url, allow_redirects=self._allow_redirects) as head:
+                content_length = head.headers.get("Content-Length")
+                if head.status == 200 and self._exceeds_cap(content_length):
+                    return _failed(url, f"File too large: {content_length} bytes", head.status)
+        return None
+
     async def fetch(self, url: str) -> JSFile:
         """Fetch a single JavaScript file.
 
@@ -39,44 +202,71 @@ class JSFetcher:
         Returns:
             JSFile with content or error.
         """
-        session = await self._get_session()
+        if not _is_fetchable(url):
+            return _failed(url, "Invalid URL")
+        return await self._download(url)
+
+    async def _download(self, url: str) -> JSFile:
+        """Fetch a URL already checked by ``_is_fetchable``."""
+        session = self._session
+        if session is None:
+            # Used without ``async with``; open the session lazily
+            session = await self._get_session()
+        max_size = self.config.max_js_size
 
         try:
+            if self._preflight and (oversize := await self._preflight_head(session, url)):
+                return oversize
+
+            cache = self._cache
             async with session.get(
                 url,
-                timeout=aiohttp.ClientTimeout(total=self.config.timeout),
-                allow_redirects=self.config.follow_redirects,
+                allow_redirects=self._allow_redirects,
+                headers=cache.headers(url) if cache is not None else None,
             ) as response:
+                if response.status == 304 and cache is not None:
+                    cached = cache.load(url)
+                    if cached is not None:
+                        # Report the cached copy as the 200 it was stored from
+                        body, charset = cached
+                        return _fetched(url, _decode(body, charset), len(body), 200)
+
                 if response.status != 200:
-                    return JSFile(
-                        url=url,
-                        status_code=response.status,
-                        error=f"HTTP {response.status}",
-                    )
+                    return _failed(url, f"HTTP {response.status}", response.status)
 
                 # Check content length
                 content_length = response.headers.get("Content-Length")
-                if content_length and int(content_length) > self.config.max_js_size:
-                    return JSFile(
-                        url=url,
-                        status_code=response.status,
-                        error=f"File too large: {content_length} bytes",
-                    )
+                if self._exceeds_cap(content_length):
+                    return _failed(url, f"File too large: {content_length} bytes", response.status)
 
-                content = await response.text()
-                return JSFile(
-                    url=url,
-                    content=content,
-                    size=len(content),
-                    status_code=response.status,
-                )
+                # Stream with a running cap, since Content-Length can be missing
+                # or wrong; the body is never buffered beyond the limit
+                buf = bytearray()
+                async for chunk in response.content.iter_chunked(_CHUNK_SIZE):
+                    buf.extend(chunk)
+                    if len(buf) > max_size:
+                        return _failed(
+                            url, f"File too large: over {max_size} bytes", response.status
+                        )
+
+                content = _decode(buf, response.charset)
+                if cache is not None:
+                    cache.store(
+                        url,
+                        bytes(buf),
+                        response.headers.get("ETag"),
+                        response.headers.get("Last-Modified"),
+                        response.charset,
+                    )
+                # Size in bytes, matching max_js_size and local files
+                return _fetched(url, content, len(buf), response.status)
 
         except TimeoutError:
-            return JSFile(url=url, error="Timeout")
+            return _failed(url, "Timeout")
         except aiohttp.ClientError as e:
-            return JSFile(url=url, error=str(e))
+            return _failed(url, str(e))
         except Exception as e:
-            return JSFile(url=url, error=f"Unexpected error: {e}")
+            return _failed(url, f"Unexpected error: {e}")
 
     async def fetch_many(
         self,
@@ -90,24 +280,115 @@ class JSFetcher:
             limit: Maximum number of files to fetch.
 
         Returns:
-            List of JSFile results.
+            List of JSFile results, in the order of ``urls``.
         """
         if limit:
             urls = urls[:limit]
 
-        semaphore = asyncio.Semaphore(self.config.max_concurrent)
+        # A bundle referenced by several tags is fetched once, and its
+        # duplicates share the result
+        unique = list(dict.fromkeys(urls))
+        results: dict[str, JSFile] = {}
+
+        async def store(index: int, js_file: JSFile) -> None:
+            results[unique[index]] = js_file
+
+        await self._fetch_into(unique, store)
+        return [results[url] for url in urls]
+
+    async def iter_fetch(
+        self,
+        urls: list[str],
+        limit: int | None = None,
+    ) -> AsyncIterator[JSFile]:
+        """Fetch multiple JavaScript files, yielding each as it completes.
+
+        Unlike ``fetch_many`` this lets a caller process a file while the
+        rest are still downloading, and only a bounded number of bodies are
+        held at once.
+
+        Args:
+            urls: List of URLs to fetch.
+            limit: Maximum number of files to fetch.
+
+        Yields:
+            JSFile results in completion order, one per distinct URL.
+        """
+        if limit:
+            urls = urls[:limit]
+        urls = list(dict.fromkeys(urls))
+
+        # Bounded so workers stall instead of buffering bodies when the
+        # consumer falls behind
+        done: asyncio.Queue[JSFile | Exception] = asyncio.Queue(maxsize=self.config.max_concurrent)
+
+        async def deliver(_index: int, js_file: JSFile) -> None:
+            await done.put(js_file)
+
+        async def produce() -> None:
+            # Hand a crash to the consumer rather than leaving it waiting
+            try:
+                await self._fetch_into(urls, deliver)
+            except Exception as e:
+                await done.put(e)
+
+        # The workers run in their own task, so the task group never spans
+        # a yield
+        producer = asyncio.create_task(produce())
+        try:
+            for _ in range(len(urls)):
+                item = await done.get()
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            # Reached early when the consumer stops iterating
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+
+    async def _fetch_into(
+        self,
+        urls: list[str],
+        deliver: Callable[[int, JSFile], Awaitable[None]],
+    ) -> None:
+        """Fetch ``urls``, passing each ``(index, JSFile)`` to ``deliver``."""
+        # A fixed set of workers drains one queue, so only max_concurrent
+        # tasks exist however long the list is
+        queue: asyncio.Queue[tuple[int, str]] = asyncio.Queue()
+        for index, url in enumerate(urls):
+            # Malformed URLs fail without taking a worker slot
+            if _is_fetchable(url):
+                queue.put_nowait((index, url))
+            else:
+                await deliver(index, _failed(url, "Invalid URL"))
+
+        # The delay limits the request rate, not concurrency: at most
+        # max_concurrent requests start per delay, and a worker only waits
+        # when that rate would be exceeded
+        pacer = None
+        if self.config.delay > 0:
+            pacer = _Pacer(self.config.delay / self.config.max_concurrent)
 
-        async def fetch_with_semaphore(url: str) -> JSFile:
-            async with semaphore:
-                result = await self.fetch(url)
-                if self.config.delay > 0:
-                    await asyncio.sleep(self.config.delay)
-                return result
+        async def worker() -> None:
+            while True:
+                try:
+                    index, url = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                if pacer is not None:
+                    await pacer.wait()
+                await deliver(index, await self._download(url))
 
-        tasks = [fetch_with_semaphore(url) for url in urls]
-        return await asyncio.gather(*tasks)
+        # A worker that crashes cancels its siblings instead of leaving the
+        # rest of the queue to the others
+        async with asyncio.TaskGroup() as group:
+            for _ in range(min(self.config.max_concurrent, queue.qsize())):
+                group.create_task(worker())
 
     async def close(self) -> None:
-        """Close the aiohttp session."""
-        if self._session and not self._session.closed:
-            await self._session.close()
+        """Close the aiohttp session and save the cache index."""
+        if self._cache is not None:
+            self._cache.save()
+        if self._session is not None:
+            session, self._session = self._session, None
+            await session.close()
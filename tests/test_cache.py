@@ -0,0 +1,94 @@
+"""Tests for the conditional-request cache."""
+
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+from aiohttp import web
+
+from jsminer.core.config import Config
+from jsminer.scanner.cache import FetchCache
+from jsminer.scanner.fetcher import JSFetcher
+
+BODY = b"var endpoint = '/api/v1/users';"
+ETAG = '"v1"'
+
+
+def test_store_and_reload_round_trip(tmp_path: Path) -> None:
+    cache = FetchCache(tmp_path)
+    cache.store("https://example.com/app.js", BODY, ETAG, None, "utf-8")
+    cache.save()
+
+    reloaded = FetchCache(tmp_path)
+    assert reloaded.headers("https://example.com/app.js") == {"If-None-Match": ETAG}
+    assert reloaded.load("https://example.com/app.js") == (BODY, "utf-8")
+
+
+def test_response_without_validators_is_not_stored(tmp_path: Path) -> None:
+    cache = FetchCache(tmp_path)
+    cache.store("https://example.com/app.js", BODY, None, None)
+    assert cache.headers("https://example.com/app.js") is None
+
+
+def test_missing_blob_drops_the_entry(tmp_path: Path) -> None:
+    cache = FetchCache(tmp_path)
+    cache.store("https://example.com/app.js", BODY, ETAG, None)
+    cache.save()
+    for blob in (tmp_path / "blobs").iterdir():
+        blob.unlink()
+
+    reloaded = FetchCache(tmp_path)
+    assert reloaded.headers("https://example.com/app.js") is None
+    reloaded.save()
+    assert FetchCache(tmp_path).load("https://example.com/app.js") is None
+
+
+@pytest.fixture
+async def server() -> AsyncIterator[tuple[str, list[int]]]:
+    """Serve app.js with an ETag, recording the status of each response."""
+    statuses: list[int] = []
+
+    async def app_js(request: web.Request) -> web.Response:
+        if request.headers.get("If-None-Match") == ETAG:
+            statuses.append(304)
+            return web.Response(status=304, headers={"ETag": ETAG})
+        statuses.append(200)
+        return web.Response(body=BODY, headers={"ETag": ETAG})
+
+    app = web.Application()
+    app.router.add_get("/app.js", app_js)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    try:
+        yield f"http://127.0.0.1:{port}/app.js", statuses
+    finally:
+        await runner.cleanup()
+
+
+async def _fetch(url: str, cache_dir: Path) -> tuple[int | None, str | None]:
+    async with JSFetcher(Config(cache_dir=str(cache_dir), delay=0)) as fetcher:
+        js_file = await fetcher.fetch(url)
+    return js_file.status_code, js_file.content
+
+
+async def test_not_modified_serves_cached_body(
+    server: tuple[str, list[int]], tmp_path: Path
+) -> None:
+    url, statuses = server
+    assert await _fetch(url, tmp_path) == (200, BODY.decode())
+    assert await _fetch(url, tmp_path) == (200, BODY.decode())
+    assert statuses == [200, 304]
+
+
+async def test_missing_blob_refetches_body(server: tuple[str, list[int]], tmp_path: Path) -> None:
+    url, statuses = server
+    await _fetch(url, tmp_path)
+    for blob in (tmp_path / "blobs").iterdir():
+        blob.unlink()
+
+    assert await _fetch(url, tmp_path) == (200, BODY.decode())
+    assert await _fetch(url, tmp_path) == (200, BODY.decode())
+    assert statuses == [200, 200, 304]